@@ -1,19 +1,93 @@
+from pandas._libs import lib
 from pandas.errors import ParserError
 from pandas.compat._optional import import_optional_dependency
+from pandas.util.version import Version
+from pandas.io._util import _arrow_dtype_mapping
 from pandas.io.parsers.base_parser import ParserBase
 
 from pandas.core.dtypes.common import pandas_dtype
 from pandas.core.dtypes.inference import is_integer
 
+from pandas import Index
+
+# Static translation of pandas read_csv kwarg names to their Polars
+# equivalents, built once at import time.
+_PANDAS_TO_POLARS = {
+    "sep": "separator",
+    "delimiter": "separator",
+    "names": "new_columns",
+    "quotechar": "quote_char",
+    "comment": "comment_prefix",
+    "storage_options": "storage_options",
+}
+
+
+# Kwargs read_many can honor through _translate_kwargs_static.
+_READ_MANY_KEYS = frozenset(
+    {
+        *_PANDAS_TO_POLARS,
+        "header",
+        "usecols",
+        "skiprows",
+        "parse_dates",
+        "on_bad_lines",
+        "dtype_backend",
+    }
+)
+
+# Prefix for the helper columns carrying scan-side date parses until
+# they are validated against the original strings.
+_DATE_HELPER = "__pandas_parsed__"
+
+
+def _streaming_kwargs(pl):
+    """
+    Kwargs selecting Polars' streaming engine for collect/collect_all.
+
+    The ``streaming`` flag was deprecated in polars 1.25 in favor of
+    ``engine="streaming"``.
+    """
+    if Version(pl.__version__) >= Version("1.25.0"):
+        return {"engine": "streaming"}
+    return {"streaming": True}
+
+
+def _as_inferred_unit(parsed):
+    """
+    Cast a scan-side date parse to the unit to_datetime would infer.
+
+    Polars always parses into microseconds; to_datetime picks the
+    coarsest unit that holds the values. as_unit truncates silently, so
+    round-trip to check the downcast is lossless.
+    """
+    if parsed.dtype.kind != "M":
+        return parsed
+    for unit in ("s", "ms"):
+        candidate = parsed.dt.as_unit(unit)
+        if candidate.dt.as_unit(parsed.dt.unit).equals(parsed):
+            return candidate
+    return parsed
+
+
 class PolarsParserWrapper(ParserBase):
     """
     CSV parser using Polars as the backend engine.
     """
 
+    # Cached polars module so repeated reads skip the
+    # optional-dependency import machinery.
+    _pl = None
+    # Lazily-built mapping of pandas dtype names to Polars dtypes, used
+    # to push user-requested casts into the query plan.
+    _pl_dtypes = None
+
     def __init__(self, src, **kwds):
         super().__init__(kwds)
         self.kwds = kwds
-        self.src = src 
+        self.src = src
+        self._projection = None
+        self._date_cols = []
+        self._translated_kwds = None
 
     def read(self, nrows=None):
         """
@@ -26,14 +100,188 @@ class PolarsParserWrapper(ParserBase):
         return df
 
     def _read_csv_with_polars(self, nrows):
-        pl = import_optional_dependency("polars")
+        pl = type(self)._pl
+        if pl is None:
+            pl = type(self)._pl = import_optional_dependency("polars")
         kwds = self._translate_kwargs()
+        src = self.src
+        tell = getattr(src, "tell", None)
+        if tell is not None and tell() > 0:
+            # scan_csv reads file-backed sources from offset zero; honor
+            # the caller's current position (GH#48646) by scanning the
+            # remaining contents instead.
+            data = src.read()
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+            src = data
+        # Build a LazyFrame over the file so the optimizer can push
+        # projections and row limits into the scan itself instead of
+        # materializing the full CSV eagerly.
+        lf = pl.scan_csv(src, **kwds)
         if nrows is not None:
-            kwds["n_rows"] = nrows 
-        lf = pl.read_csv(self.src, **kwds).lazy()
-        df = lf.collect().to_pandas()
+            lf = lf.head(nrows)
+        if self._projection is not None:
+            lf = self._apply_projection(lf, self._projection)
+        lf = self._push_dtype_casts(pl, lf)
+        date_cols = []
+        if self._date_cols:
+            # Fuse date parsing into the query plan so it runs in one pass
+            # with the scan rather than as a second pass over the pandas
+            # frame. The parses land in helper columns and only replace
+            # the originals after validation in _resolve_pushed_dates.
+            schema = lf.collect_schema()
+            date_cols = [
+                c for c in self._date_cols if c in schema and schema[c] == pl.String
+            ]
+        # Streaming execution processes the file in bounded batches, so
+        # peak memory scales with the batch size rather than the file.
+        if date_cols:
+            dated = lf.with_columns(
+                [
+                    pl.col(c)
+                    .str.strptime(pl.Datetime, strict=False)
+                    .alias(_DATE_HELPER + c)
+                    for c in date_cols
+                ]
+            )
+            try:
+                df = self._to_pandas(dated.collect(**_streaming_kwargs(pl)))
+            except pl.exceptions.ComputeError:
+                # strptime without a format refuses tz-aware strings;
+                # collect the plain plan and leave those columns to
+                # _do_date_conversions.
+                date_cols = []
+        if not date_cols:
+            df = self._to_pandas(lf.collect(**_streaming_kwargs(pl)))
+        else:
+            df = self._resolve_pushed_dates(df, date_cols)
         return self._finalize_pandas_output(df)
 
+    def _resolve_pushed_dates(self, frame, date_cols):
+        """
+        Adopt scan-side date parses only where they are lossless.
+
+        The non-strict strptime nulls out unparseable entries, whereas
+        pandas semantics leave such a column unconverted. Keep a parsed
+        column only when it introduced no new nulls, matching the unit
+        to_datetime would have inferred; otherwise drop it and leave the
+        original strings to _do_date_conversions.
+        """
+        for col in date_cols:
+            parsed = frame.pop(_DATE_HELPER + col)
+            if parsed.isna().sum() == frame[col].isna().sum():
+                frame[col] = _as_inferred_unit(parsed)
+                self.parse_dates = [c for c in self.parse_dates if c != col]
+        return frame
+
+    def _push_dtype_casts(self, pl, lf):
+        """
+        Move user-requested dtype casts into the LazyFrame.
+
+        Casts with a Polars equivalent run vectorized in the same pass as
+        the scan. The keys stay in ``self.dtype``: when the cast survives
+        the pandas conversion the no-op filter in
+        ``_finalize_pandas_output`` skips it for free, and when it does
+        not (e.g. nulls widening an integer column to float64) the
+        pandas-side astype still applies or raises as requested.
+        """
+        if not isinstance(self.dtype, dict):
+            return lf
+        dtype_map = type(self)._pl_dtypes
+        if dtype_map is None:
+            dtype_map = type(self)._pl_dtypes = {
+                "int8": pl.Int8,
+                "int16": pl.Int16,
+                "int32": pl.Int32,
+                "int64": pl.Int64,
+                "uint8": pl.UInt8,
+                "uint16": pl.UInt16,
+                "uint32": pl.UInt32,
+                "uint64": pl.UInt64,
+                "float32": pl.Float32,
+                "float64": pl.Float64,
+                "bool": pl.Boolean,
+            }
+        schema = lf.collect_schema()
+        casts = {}
+        for col, dt in self.dtype.items():
+            if not isinstance(col, str) or col not in schema:
+                continue
+            pl_dtype = dtype_map.get(pandas_dtype(dt).name)
+            if pl_dtype is not None:
+                casts[col] = pl_dtype
+        if casts:
+            lf = lf.with_columns([pl.col(c).cast(t) for c, t in casts.items()])
+        return lf
+
+    def _to_pandas(self, pl_df):
+        return self._convert_to_pandas(
+            pl_df, self.kwds.get("dtype_backend", lib.no_default)
+        )
+
+    @staticmethod
+    def _apply_projection(lf, projection):
+        """
+        Select the usecols projection on a LazyFrame.
+
+        Positional usecols are resolved to names from the scanned schema
+        so the projection is still pushed down into the scan.
+        """
+        if all(is_integer(col) for col in projection):
+            schema_names = lf.collect_schema().names()
+            projection = [schema_names[i] for i in projection]
+        return lf.select(projection)
+
+    @staticmethod
+    def _convert_to_pandas(pl_df, dtype_backend):
+        """
+        Convert a collected Polars frame to pandas, honoring dtype_backend.
+
+        For the "pyarrow" backend the resulting columns share the Arrow
+        buffers with the Polars frame instead of copying into NumPy arrays.
+        """
+        if dtype_backend == "pyarrow":
+            return pl_df.to_pandas(use_pyarrow_extension_array=True)
+        elif dtype_backend == "numpy_nullable":
+            return pl_df.to_pandas(types_mapper=_arrow_dtype_mapping().get)
+        return pl_df.to_pandas()
+
+    @classmethod
+    def read_many(cls, srcs, **kwds):
+        """
+        Read multiple CSV files in parallel and return a list of DataFrames.
+
+        One LazyFrame is built per source and all of them are collected
+        through a single ``pl.collect_all`` call, so the files are parsed
+        concurrently on Polars' thread pool instead of serializing one
+        collect per file.
+
+        Only the kwargs ``_translate_kwargs_static`` handles are
+        accepted; anything else raises rather than being silently
+        dropped.
+        """
+        pl = cls._pl
+        if pl is None:
+            pl = cls._pl = import_optional_dependency("polars")
+        unsupported = set(kwds) - _READ_MANY_KEYS
+        if unsupported:
+            raise NotImplementedError(
+                f"read_many does not support {sorted(unsupported)}"
+            )
+        if "parse_dates" in kwds and not isinstance(kwds["parse_dates"], bool):
+            raise NotImplementedError(
+                "read_many only supports boolean parse_dates"
+            )
+        polars_kwargs, projection = cls._translate_kwargs_static(kwds)
+        lfs = [pl.scan_csv(src, **polars_kwargs) for src in srcs]
+        if projection is not None:
+            lfs = [cls._apply_projection(lf, projection) for lf in lfs]
+        dtype_backend = kwds.get("dtype_backend", lib.no_default)
+        return [
+            cls._convert_to_pandas(pl_df, dtype_backend)
+            for pl_df in pl.collect_all(lfs, **_streaming_kwargs(pl))
+        ]
+
 
     def _finalize_pandas_output(self, frame):
         """
@@ -53,32 +301,45 @@ class PolarsParserWrapper(ParserBase):
         multi_index_named = True
         if self.header is None:
             if self.names is None:
-                if self.header is None:
-                    self.names = range(num_cols)
+                self.names = range(num_cols)
             if len(self.names) != num_cols:
-                columns_prefix = [str(x) for x in range(num_cols - len(self.names))]
-                self.names = columns_prefix + self.names
+                # Build the filler labels through Index operations rather
+                # than churning per-element Python string objects and
+                # concatenating lists.
+                columns_prefix = Index(range(num_cols - len(self.names))).astype(str)
+                self.names = columns_prefix.append(Index(self.names))
                 multi_index_named = False
-            frame.columns = self.names
+            frame = frame.set_axis(self.names, axis=1)
 
         frame = self._do_date_conversions(frame.columns, frame)
         if self.index_col is not None:
             index_to_set = self.index_col.copy()
+            # Collect dtype casts for index columns and apply them in one
+            # astype call instead of one column assignment per iteration.
+            index_dtype_map = {}
+            # Avoid repeated O(ncols) scans of the columns Index inside
+            # the loop.
+            col_set = set(frame.columns)
+            col_list = list(frame.columns)
             for i, item in enumerate(self.index_col):
                 if is_integer(item):
-                    index_to_set[i] = frame.columns[item]
-                elif item not in frame.columns:
+                    index_to_set[i] = col_list[item]
+                elif item not in col_set:
                     raise ValueError(f"Index {item} invalid")
 
                 if self.dtype is not None:
                     key, new_dtype = (
                         (item, self.dtype.get(item))
                         if self.dtype.get(item) is not None
-                        else (frame.columns[item], self.dtype.get(frame.columns[item]))
+                        else (col_list[item], self.dtype.get(col_list[item]))
                     )
                     if new_dtype is not None:
-                        frame[key] = frame[key].astype(new_dtype)
-                        del self.dtype[key]
+                        index_dtype_map[key] = new_dtype
+
+            if index_dtype_map:
+                frame = frame.astype(index_dtype_map)
+                for key in index_dtype_map:
+                    self.dtype.pop(key, None)
 
             frame.set_index(index_to_set, drop=True, inplace=True)
             # Clear names if headerless and no name given
@@ -87,35 +348,73 @@ class PolarsParserWrapper(ParserBase):
 
         if self.dtype is not None:
             if isinstance(self.dtype, dict):
+                # Only cast columns whose inferred dtype actually differs;
+                # astype copies each column even when the cast is a no-op.
+                current = frame.dtypes
                 self.dtype = {
                     k: pandas_dtype(v)
                     for k, v in self.dtype.items()
                     if k in frame.columns
                 }
+                self.dtype = {
+                    k: v for k, v in self.dtype.items() if current[k] != v
+                }
             else:
                 self.dtype = pandas_dtype(self.dtype)
-            try:
-                frame = frame.astype(self.dtype)
-            except TypeError as err:
-                # GH#44901 reraise to keep api consistent
-                raise ValueError(str(err)) from err
+                if (frame.dtypes == self.dtype).all():
+                    self.dtype = None
+            if self.dtype is not None and self.dtype != {}:
+                try:
+                    frame = frame.astype(self.dtype)
+                except TypeError as err:
+                    # GH#44901 reraise to keep api consistent
+                    raise ValueError(str(err)) from err
         return frame
 
     def _translate_kwargs(self):
         """
         Translate pandas read_csv kwargs to Polars-compatible kwargs.
+
+        The result is memoized: self.kwds is fixed for the lifetime of the
+        parser, so repeated reads (chunked iteration) reuse the first
+        translation instead of re-running it per call.
         """
-        opts = self.kwds.copy()
-        polars_kwargs = {}
+        if self._translated_kwds is not None:
+            return self._translated_kwds
+        polars_kwargs, projection = self._translate_kwargs_static(self.kwds)
+        # parse_dates is popped from kwds by ParserBase, so overlay the
+        # normalized attribute here.
+        if isinstance(self.parse_dates, bool):
+            polars_kwargs["try_parse_dates"] = self.parse_dates
+        elif (
+            isinstance(self.parse_dates, list)
+            and self.date_format is None
+            and not self.dayfirst
+        ):
+            # Named string columns can be parsed inside the scan itself,
+            # but only with the default date options: date_format and
+            # dayfirst are honored by _do_date_conversions, not by the
+            # pushed-down strptime. Anything else falls back to
+            # _do_date_conversions.
+            self._date_cols = [c for c in self.parse_dates if isinstance(c, str)]
+        if projection is not None:
+            self._projection = projection
+        self._translated_kwds = polars_kwargs
+        return polars_kwargs
 
-        mapping = {
-            "sep": ("separator", lambda v: v),
-            "delimiter": ("separator", lambda v: v),
-            "names": ("new_columns", lambda v: v),
-            "quotechar": ("quote_char", lambda v: v),
-            "comment": ("comment_prefix", lambda v: v),
-            "storage_options": ("storage_options", lambda v: v),
-        }
+    @staticmethod
+    def _translate_kwargs_static(opts):
+        """
+        Translate a pandas read_csv kwargs dict to Polars-compatible kwargs.
+
+        Returns
+        -------
+        tuple
+            The translated kwargs dict, and the column projection from
+            ``usecols`` to apply after the scan (or None).
+        """
+        polars_kwargs = {}
+        projection = None
 
         # Handling for header options
         header = opts.get("header", "infer")
@@ -132,33 +431,50 @@ class PolarsParserWrapper(ParserBase):
             )
         
         # Handling for column selection
-        if "usecols" in opts:
-            usecols = opts["usecols"]
+        usecols = opts.get("usecols")
+        if usecols is not None:
             if callable(usecols):
                 raise NotImplementedError("Polars does not support callable usecols argument")
             else:
-                polars_kwargs["columns"] = usecols
+                # Applied as a post-scan select so the projection is
+                # pushed down into the scan node.
+                projection = list(usecols)
         
         # Handling number of rows to be skipped while parsing
         if "skiprows" in opts:
             skiprows = opts["skiprows"]
-            if len(skiprows) == 0:
-                polars_kwargs["skip_rows"] = 0
-            elif len(skiprows) == 1 and isinstance(skiprows[0], int):
-                polars_kwargs["skip_rows"] = skiprows[0]
+            if callable(skiprows):
+                raise NotImplementedError(
+                    "Polars does not support callable skiprows argument"
+                )
+            if is_integer(skiprows):
+                polars_kwargs["skip_rows"] = skiprows
+            elif isinstance(skiprows, (list, tuple, set, range)):
+                s = sorted(set(skiprows))
+                if not s:
+                    polars_kwargs["skip_rows"] = 0
+                elif s == list(range(s[-1] + 1)):
+                    # A contiguous block of leading rows maps onto
+                    # Polars' native skip_rows fast path.
+                    polars_kwargs["skip_rows"] = s[-1] + 1
+                else:
+                    raise NotImplementedError(
+                        "Polars only supports skipping a contiguous block of "
+                        "leading rows"
+                    )
             else:
                 raise NotImplementedError(
-                    "Polars does not support skipping multiple rows or callable skiprows argument"
+                    f"Polars does not support skiprows={skiprows!r}"
                 )
 
         # Handling date parsing options
-        if isinstance(self.parse_dates, bool):
-            polars_kwargs["try_parse_dates"] = self.parse_dates
+        if isinstance(opts.get("parse_dates"), bool):
+            polars_kwargs["try_parse_dates"] = opts["parse_dates"]
 
         # Translate options to Polars kwargs
-        for pd_key, (pl_key, transform) in mapping.items():
+        for pd_key, pl_key in _PANDAS_TO_POLARS.items():
             if pd_key in opts:
-                val = transform(opts[pd_key])
+                val = opts[pd_key]
                 if val is not None:
                     polars_kwargs[pl_key] = val
 
@@ -166,4 +482,4 @@ class PolarsParserWrapper(ParserBase):
         polars_kwargs["raise_if_empty"] = on_bad_lines == "error"
         polars_kwargs["ignore_errors"] = on_bad_lines in {"warn", "skip"}
 
-        return polars_kwargs
+        return polars_kwargs, projection
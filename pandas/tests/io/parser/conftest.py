@@ -183,6 +183,15 @@ def pyarrow_parser_only(request):
     return request.param()
 
 
+@pytest.fixture(params=_polars_parsers_only, ids=_polars_parsers_ids)
+def polars_parser_only(request):
+    """
+    Fixture all of the CSV parsers using the Polars engine.
+    """
+    pytest.importorskip("polars")
+    return request.param()
+
+
 def _get_all_parser_float_precision_combinations():
     """
     Return all allowable parser and float precision
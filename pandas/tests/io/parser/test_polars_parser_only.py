@@ -0,0 +1,165 @@
+"""
+Tests that apply specifically to the polars engine of read_csv. These
+cover translation behavior the shared parser suite does not pin down,
+e.g. which skiprows forms map onto Polars' native skip_rows.
+"""
+
+from io import StringIO
+
+import pytest
+
+from pandas.errors import ParserError
+
+from pandas import (
+    ArrowDtype,
+    DataFrame,
+    Series,
+    to_datetime,
+)
+import pandas._testing as tm
+
+from pandas.io.parsers.polar_parser_wrapper import PolarsParserWrapper
+
+
+def test_skiprows_integer(polars_parser_only):
+    # An integer skiprows maps onto Polars' native skip_rows.
+    parser = polars_parser_only
+    data = "junk1\njunk2\na,b\n1,2\n3,4\n"
+
+    result = parser.read_csv(StringIO(data), skiprows=2)
+    expected = DataFrame({"a": [1, 3], "b": [2, 4]})
+    tm.assert_frame_equal(result, expected)
+
+
+def test_skiprows_leading_list(polars_parser_only):
+    # A contiguous block of leading rows collapses to skip_rows.
+    parser = polars_parser_only
+    data = "junk1\njunk2\na,b\n1,2\n3,4\n"
+
+    result = parser.read_csv(StringIO(data), skiprows=[0, 1])
+    expected = DataFrame({"a": [1, 3], "b": [2, 4]})
+    tm.assert_frame_equal(result, expected)
+
+
+def test_dtype_backend_pyarrow(polars_parser_only):
+    # dtype_backend="pyarrow" converts via pyarrow extension arrays that
+    # share the Arrow buffers with the Polars frame.
+    pytest.importorskip("pyarrow")
+    parser = polars_parser_only
+    data = "a,b\n1,x\n2,y\n"
+
+    result = parser.read_csv(StringIO(data), dtype_backend="pyarrow")
+    assert all(isinstance(dtype, ArrowDtype) for dtype in result.dtypes)
+    assert result["a"].tolist() == [1, 2]
+    assert result["b"].tolist() == ["x", "y"]
+
+
+def test_dtype_backend_numpy_nullable(polars_parser_only):
+    # dtype_backend="numpy_nullable" maps Arrow types onto the masked
+    # nullable dtypes instead of widening nulled integers to float.
+    pytest.importorskip("pyarrow")
+    parser = polars_parser_only
+    data = "a,b\n1,2\n,4\n"
+
+    result = parser.read_csv(StringIO(data), dtype_backend="numpy_nullable")
+    expected = DataFrame(
+        {
+            "a": Series([1, None], dtype="Int64"),
+            "b": Series([2, 4], dtype="Int64"),
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_usecols_positional(polars_parser_only):
+    # Integer usecols are resolved to names from the scanned schema so
+    # the projection is still pushed into the scan.
+    parser = polars_parser_only
+    data = "a,b,c\n1,2,3\n4,5,6\n"
+
+    result = parser.read_csv(StringIO(data), usecols=[0, 2])
+    expected = DataFrame({"a": [1, 4], "c": [3, 6]})
+    tm.assert_frame_equal(result, expected)
+
+
+def test_skiprows_non_contiguous_raises(polars_parser_only):
+    # Non-leading row skips have no Polars equivalent.
+    parser = polars_parser_only
+    data = "junk1\na,b\njunk2\n1,2\n"
+
+    with pytest.raises(ParserError, match="contiguous"):
+        parser.read_csv(StringIO(data), skiprows=[0, 2])
+
+
+def test_parse_dates_pushdown(polars_parser_only):
+    # A clean column parsed inside the scan matches what
+    # _do_date_conversions produces, including the inferred unit.
+    parser = polars_parser_only
+    data = "a,d\n1,2020-01-01\n2,2020-01-02\n"
+
+    result = parser.read_csv(StringIO(data), parse_dates=["d"])
+    expected = DataFrame(
+        {"a": [1, 2], "d": to_datetime(["2020-01-01", "2020-01-02"])}
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_parse_dates_unparseable_left_unconverted(polars_parser_only):
+    # Unparseable entries must not be nulled out; pandas leaves the
+    # column unconverted.
+    parser = polars_parser_only
+    data = "a,d\n1,2020-01-01\n2,notadate\n"
+
+    result = parser.read_csv(StringIO(data), parse_dates=["d"])
+    expected = DataFrame(
+        {"a": [1, 2], "d": Series(["2020-01-01", "notadate"], dtype=object)}
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_read_many(tmp_path):
+    # read_many collects all sources through one collect_all call.
+    pytest.importorskip("polars")
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"file{i}.csv"
+        path.write_text(f"a,b\n{i},2\n3,4\n")
+        paths.append(str(path))
+
+    results = PolarsParserWrapper.read_many(paths)
+    assert len(results) == 2
+    for i, result in enumerate(results):
+        expected = DataFrame({"a": [i, 3], "b": [2, 4]})
+        tm.assert_frame_equal(result, expected)
+
+
+def test_read_many_usecols(tmp_path):
+    # The usecols projection applies to every source.
+    pytest.importorskip("polars")
+    path = tmp_path / "file.csv"
+    path.write_text("a,b,c\n1,2,3\n")
+
+    results = PolarsParserWrapper.read_many([str(path)], usecols=["a", "c"])
+    expected = DataFrame({"a": [1], "c": [3]})
+    tm.assert_frame_equal(results[0], expected)
+
+
+def test_read_many_usecols_positional(tmp_path):
+    # Integer usecols resolve against each scanned schema, same as read.
+    pytest.importorskip("polars")
+    path = tmp_path / "file.csv"
+    path.write_text("a,b,c\n1,2,3\n")
+
+    results = PolarsParserWrapper.read_many([str(path)], usecols=[0, 2])
+    expected = DataFrame({"a": [1], "c": [3]})
+    tm.assert_frame_equal(results[0], expected)
+
+
+def test_read_many_unsupported_kwarg_raises(tmp_path):
+    # Kwargs without a translation raise instead of being dropped.
+    pytest.importorskip("polars")
+    path = tmp_path / "file.csv"
+    path.write_text("a,b\n1,2\n")
+
+    with pytest.raises(NotImplementedError, match="dtype"):
+        PolarsParserWrapper.read_many([str(path)], dtype={"a": "float64"})